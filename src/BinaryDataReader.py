@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+import mmap
+import random
+import struct
+from typing import Iterator, Optional
+from .Types import DataType
+from .DataReader import DataReader
+from .DebtCalculation import DebtCalculation
+
+# Формат файла (все числа little-endian):
+#   заголовок    - HEADER
+#   предметы     - для каждого предмета длина (SUBJECT_LEN) и имя в UTF-8
+#   индекс       - INDEX_ENTRY на студента, отсортирован по имени,
+#                  с порядковым номером студента в исходных данных
+#   имена        - имена студентов в UTF-8 подряд
+#   оценки       - SCORE_ENTRY на оценку, блоки в исходном порядке;
+#                  значение хранится как INT_SCORE или FLOAT_SCORE
+#                  в зависимости от флага
+# Смещения и длины хранятся как 32-битные беззнаковые числа, поэтому
+# весь файл не может превышать 4 ГиБ (MAX_FILE_SIZE), а имя предмета -
+# 65535 байт в UTF-8 (MAX_SUBJECT_LEN).
+MAGIC = b"GRDB"
+VERSION = 2
+HEADER = struct.Struct("<4sHHIIIIII")
+SUBJECT_LEN = struct.Struct("<H")
+INDEX_ENTRY = struct.Struct("<IIIII")
+SCORE_ENTRY = struct.Struct("<IB8s")
+INT_SCORE = struct.Struct("<q")
+FLOAT_SCORE = struct.Struct("<d")
+INT_FLAG = 0
+FLOAT_FLAG = 1
+MAX_FILE_SIZE = 2 ** 32 - 1
+MAX_SUBJECT_LEN = 2 ** 16 - 1
+
+
+class BinaryGradeFile:
+    """Доступ к двоичному файлу оценок без загрузки всего набора данных
+
+    Файл отображается в память через mmap, поиск студента выполняется
+    двоичным поиском по отсортированному индексу имен за O(log n).
+    """
+
+    def __init__(self, path: str) -> None:
+        """Открывает файл и читает заголовок и словарь предметов
+
+        Args:
+            path: путь к двоичному файлу
+
+        Raises:
+            FileNotFoundError: если файл не найден
+            ValueError: если файл не является файлом оценок или
+                его заголовок, словарь предметов или индекс повреждены
+        """
+        with open(path, 'rb') as file:
+            try:
+                self.buffer = mmap.mmap(file.fileno(), 0,
+                                        access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"Файл {path} пуст")
+
+        try:
+            (magic, version, _, self.count, subjects_count,
+             subjects_off, self.index_off, self.names_off,
+             self.scores_off) = HEADER.unpack_from(self.buffer, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Неизвестный формат файла {path}")
+            if not (HEADER.size <= subjects_off <= self.index_off
+                    <= self.names_off <= self.scores_off
+                    <= len(self.buffer)):
+                raise ValueError("неверные смещения разделов")
+            if (self.index_off + self.count * INDEX_ENTRY.size
+                    > self.names_off):
+                raise ValueError("индекс выходит за границы раздела")
+            self.subjects = self._read_subjects(subjects_off, subjects_count)
+        except (ValueError, struct.error) as e:
+            self.close()
+            raise ValueError(f"Поврежденный файл оценок: {e}")
+
+    def __enter__(self) -> "BinaryGradeFile":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, student: str) -> bool:
+        return self._find(student) is not None
+
+    def close(self) -> None:
+        """Закрывает отображение файла в память"""
+        self.buffer.close()
+
+    def get(self, student: str) -> Optional[list[tuple[str, int]]]:
+        """Возвращает оценки одного студента
+
+        Args:
+            student: имя студента
+
+        Returns:
+            список пар (предмет, оценка) или None, если студента нет
+        """
+        position = self._find(student)
+        if position is None:
+            return None
+        return self._read_scores(position)
+
+    def has_debt(self, student: str) -> bool:
+        """Проверяет наличие задолженностей у одного студента
+
+        Args:
+            student: имя студента
+
+        Returns:
+            bool: True если есть хотя бы одна оценка < 61
+
+        Raises:
+            KeyError: если студента нет в файле
+        """
+        subjects = self.get(student)
+        if subjects is None:
+            raise KeyError(student)
+        return DebtCalculation.has_debt(subjects)
+
+    def __iter__(self) -> Iterator[tuple[str, list[tuple[str, int]]]]:
+        """Перебирает студентов в порядке индекса (по имени)"""
+        for position in range(self.count):
+            yield self._name(position), self._read_scores(position)
+
+    def iter_shuffled(self, rng: random.Random) -> Iterator[
+            tuple[str, list[tuple[str, int]]]]:
+        """Перебирает студентов в случайном порядке
+
+        Перестановка строится лениво (алгоритм Фишера-Йетса со
+        словарем переставленных позиций), поэтому память растет
+        только с числом уже выданных студентов.
+
+        Args:
+            rng: генератор случайных чисел
+
+        Returns:
+            итератор пар (имя студента, список оценок)
+        """
+        swapped: dict[int, int] = {}
+        for i in range(self.count):
+            j = rng.randrange(i, self.count)
+            current = swapped.pop(i, i)
+            if j == i:
+                position = current
+            else:
+                position = swapped.get(j, j)
+                swapped[j] = current
+            yield self._name(position), self._read_scores(position)
+
+    def read_all(self) -> DataType:
+        """Читает все данные в исходном порядке студентов
+
+        Returns:
+            DataType: словарь с данными студентов и их оценок
+        """
+        order = [-1] * self.count
+        for position in range(self.count):
+            seq = self._entry(position)[4]
+            if seq >= self.count or order[seq] != -1:
+                raise ValueError(f"Поврежденный файл оценок: неверный "
+                                 f"порядковый номер {seq}")
+            order[seq] = position
+        students: DataType = {}
+        for position in order:
+            students[self._name(position)] = self._read_scores(position)
+        return students
+
+    def _read_subjects(self, offset: int, count: int) -> list[str]:
+        subjects = []
+        for _ in range(count):
+            if offset + SUBJECT_LEN.size > self.index_off:
+                raise ValueError("словарь предметов выходит за границы")
+            (length,) = SUBJECT_LEN.unpack_from(self.buffer, offset)
+            offset += SUBJECT_LEN.size
+            if offset + length > self.index_off:
+                raise ValueError("словарь предметов выходит за границы")
+            subjects.append(
+                self.buffer[offset:offset + length].decode('utf-8'))
+            offset += length
+        return subjects
+
+    def _entry(self, position: int) -> tuple[int, int, int, int, int]:
+        return INDEX_ENTRY.unpack_from(
+            self.buffer, self.index_off + position * INDEX_ENTRY.size)
+
+    def _name_bytes(self, position: int) -> bytes:
+        name_off, name_len = self._entry(position)[:2]
+        start = self.names_off + name_off
+        if start + name_len > self.scores_off:
+            raise ValueError(f"Поврежденный файл оценок: имя студента "
+                             f"{position} выходит за границы раздела")
+        return self.buffer[start:start + name_len]
+
+    def _name(self, position: int) -> str:
+        return self._name_bytes(position).decode('utf-8')
+
+    def _find(self, student: str) -> Optional[int]:
+        # порядок байтов UTF-8 совпадает с порядком кодовых точек
+        key = student.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_bytes(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._name_bytes(low) == key:
+            return low
+        return None
+
+    def _read_scores(self, position: int) -> list[tuple[str, int]]:
+        block_off, count = self._entry(position)[2:4]
+        offset = self.scores_off + block_off
+        end = offset + count * SCORE_ENTRY.size
+        if end > len(self.buffer):
+            raise ValueError(f"Поврежденный файл оценок: оценки студента "
+                             f"{position} выходят за границы файла")
+        subjects = []
+        for subject_id, flag, value in SCORE_ENTRY.iter_unpack(
+                self.buffer[offset:end]):
+            if subject_id >= len(self.subjects) or flag not in (
+                    INT_FLAG, FLOAT_FLAG):
+                raise ValueError(f"Поврежденный файл оценок: неверная "
+                                 f"оценка студента {position}")
+            score_format = FLOAT_SCORE if flag == FLOAT_FLAG else INT_SCORE
+            (score,) = score_format.unpack(value)
+            subjects.append((self.subjects[subject_id], score))
+        return subjects
+
+
+class BinaryDataReader(DataReader):
+
+    supports_shuffle = True
+
+    def read(self, path: str) -> DataType:
+        """Читает все данные из двоичного файла оценок
+
+        Args:
+            path: путь к двоичному файлу
+
+        Returns:
+            DataType: словарь с данными студентов и их оценок
+
+        Raises:
+            FileNotFoundError: если файл не найден
+            ValueError: если файл поврежден или имеет другой формат
+        """
+        with BinaryGradeFile(path) as grades:
+            return grades.read_all()
+
+    def iter_students(self, path: str) -> Iterator[
+            tuple[str, list[tuple[str, int]]]]:
+        """Перебирает студентов без загрузки всего файла
+
+        Args:
+            path: путь к двоичному файлу
+
+        Returns:
+            итератор пар (имя студента, список оценок) в порядке имен
+        """
+        with BinaryGradeFile(path) as grades:
+            yield from grades
+
+    def iter_shuffled(self, path: str, rng: random.Random) -> Iterator[
+            tuple[str, list[tuple[str, int]]]]:
+        """Перебирает студентов в случайном порядке без загрузки файла
+
+        Args:
+            path: путь к двоичному файлу
+            rng: генератор случайных чисел
+
+        Returns:
+            итератор пар (имя студента, список оценок)
+        """
+        with BinaryGradeFile(path) as grades:
+            yield from grades.iter_shuffled(rng)
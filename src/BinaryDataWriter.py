@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+from .Types import DataType
+from .BinaryDataReader import (MAGIC, VERSION, HEADER, SUBJECT_LEN,
+                               INDEX_ENTRY, SCORE_ENTRY, INT_SCORE,
+                               FLOAT_SCORE, INT_FLAG, FLOAT_FLAG,
+                               MAX_FILE_SIZE, MAX_SUBJECT_LEN)
+
+INT_MIN = -2 ** 63
+INT_MAX = 2 ** 63 - 1
+
+
+class BinaryDataWriter:
+    """Класс для записи данных студентов в двоичный формат,
+    читаемый BinaryDataReader и BinaryGradeFile"""
+
+    def write(self, data: DataType, path: str) -> None:
+        """Записывает данные в двоичный файл оценок
+
+        Порядок студентов и их предметов, а также тип оценок (целое
+        или дробное число) сохраняются, поэтому BinaryDataReader.read
+        вернет данные, равные исходным.
+
+        Args:
+            data: данные о студентах и их оценках
+            path: путь к создаваемому файлу
+
+        Raises:
+            ValueError: если оценка не является числом, целая оценка
+                не помещается в 64 бита, имя предмета длиннее
+                MAX_SUBJECT_LEN байт или файл превысил бы MAX_FILE_SIZE
+        """
+        subject_ids: dict[str, int] = {}
+        scores = bytearray()
+        blocks: dict[bytes, tuple[int, int, int]] = {}
+
+        for seq, (student, subjects) in enumerate(data.items()):
+            blocks[student.encode('utf-8')] = (len(scores), len(subjects),
+                                               seq)
+            for subject, score in subjects:
+                subject_id = subject_ids.setdefault(subject,
+                                                    len(subject_ids))
+                scores += SCORE_ENTRY.pack(subject_id,
+                                           *self._pack_score(subject,
+                                                             score))
+
+        subjects_section = bytearray()
+        for subject in subject_ids:
+            encoded = subject.encode('utf-8')
+            if len(encoded) > MAX_SUBJECT_LEN:
+                raise ValueError(f"Название предмета длиннее "
+                                 f"{MAX_SUBJECT_LEN} байт: "
+                                 f"{subject[:50]}...")
+            subjects_section += SUBJECT_LEN.pack(len(encoded)) + encoded
+
+        size = (HEADER.size + len(subjects_section)
+                + len(blocks) * INDEX_ENTRY.size
+                + sum(len(name) for name in blocks) + len(scores))
+        if size > MAX_FILE_SIZE:
+            raise ValueError(f"Файл оценок превысил бы "
+                             f"{MAX_FILE_SIZE} байт: {size}")
+
+        index = bytearray()
+        names = bytearray()
+        for name in sorted(blocks):
+            block_off, count, seq = blocks[name]
+            index += INDEX_ENTRY.pack(len(names), len(name),
+                                      block_off, count, seq)
+            names += name
+
+        subjects_off = HEADER.size
+        index_off = subjects_off + len(subjects_section)
+        names_off = index_off + len(index)
+        scores_off = names_off + len(names)
+        header = HEADER.pack(MAGIC, VERSION, 0, len(blocks),
+                             len(subject_ids), subjects_off, index_off,
+                             names_off, scores_off)
+
+        with open(path, 'wb') as file:
+            file.write(header)
+            file.write(subjects_section)
+            file.write(index)
+            file.write(names)
+            file.write(scores)
+
+    def _pack_score(self, subject: str, score: float) -> tuple[int, bytes]:
+        """Упаковывает оценку вместе с флагом ее типа
+
+        Args:
+            subject: название предмета (для сообщения об ошибке)
+            score: оценка
+
+        Returns:
+            tuple[int, bytes]: флаг типа и упакованное значение
+
+        Raises:
+            ValueError: если оценка не является числом или целая
+                оценка не помещается в 64 бита
+        """
+        if isinstance(score, float):
+            return FLOAT_FLAG, FLOAT_SCORE.pack(score)
+        if isinstance(score, bool) or not isinstance(score, int):
+            raise ValueError(f"Оценка должна быть числом: {score} "
+                             f"для предмета {subject}")
+        if not INT_MIN <= score <= INT_MAX:
+            raise ValueError(f"Оценка вне допустимого диапазона: {score} "
+                             f"для предмета {subject}")
+        return INT_FLAG, INT_SCORE.pack(score)
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from typing import Iterable, Optional
 from .Types import DataType
 
 RatingType = dict[str, float]
@@ -10,8 +11,12 @@ class CalcRating:
         self.data: DataType = data
         self.rating: RatingType = {}
 
-    def calc(self) -> RatingType:
-        for key in self.data:
+    def calc(self, keys: Optional[Iterable[str]] = None) -> RatingType:
+        for key in self.data if keys is None else keys:
+            if not self.data.get(key):
+                # студент удален или оценок по нему еще нет
+                self.rating.pop(key, None)
+                continue
             self.rating[key] = 0.0
             for subject in self.data[key]:
                 self.rating[key] += subject[1]
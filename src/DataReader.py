@@ -1,10 +1,53 @@
 # -*- coding: utf-8 -*-
+import random
+from typing import Iterator
 from .Types import DataType
 from abc import ABC, abstractmethod
 
 
 class DataReader(ABC):
 
+    # True, если читатель реализует iter_shuffled
+    supports_shuffle: bool = False
+
     @abstractmethod
     def read(self, path: str) -> DataType:
         pass
+
+    def iter_students(self, path: str) -> Iterator[
+            tuple[str, list[tuple[str, int]]]]:
+        """Перебирает студентов файла по одному
+
+        По умолчанию загружает файл целиком через read; читатели,
+        умеющие читать файл потоком, переопределяют метод.
+
+        Args:
+            path: путь к файлу
+
+        Returns:
+            итератор пар (имя студента, список оценок)
+        """
+        yield from self.read(path).items()
+
+    def iter_shuffled(self, path: str, rng: random.Random) -> Iterator[
+            tuple[str, list[tuple[str, int]]]]:
+        """Перебирает студентов файла в случайном порядке
+
+        Нужен для оценок по префиксу потока (StreamingStatistics
+        с ранней остановкой). Поддерживается только читателями
+        со случайным доступом к студентам, у которых
+        supports_shuffle равен True.
+
+        Args:
+            path: путь к файлу
+            rng: генератор случайных чисел
+
+        Returns:
+            итератор пар (имя студента, список оценок)
+
+        Raises:
+            NotImplementedError: если читатель не поддерживает
+                случайный порядок
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} не поддерживает случайный порядок")
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from typing import Iterable
 from .Types import DataType
 
 
@@ -13,6 +14,7 @@ class DebtCalculation:
             data: данные о студентах и их оценках
         """
         self.data = data
+        self.debtors: set[str] = set()
 
     def count_students_with_debts(self) -> int:
         """Подсчитывает количество студентов
@@ -21,13 +23,34 @@ class DebtCalculation:
         Returns:
             int: количество студентов с хотя бы одной оценкой < 61
         """
-        count = 0
-        for student, subjects in self.data.items():
-            if self._has_debt(subjects):
-                count += 1
-        return count
+        self.debtors = set()
+        return self.update(self.data)
 
-    def _has_debt(self, subjects: list) -> bool:
+    def update(self, students: Iterable[str]) -> int:
+        """Пересчитывает задолженности только для указанных студентов
+
+        Используется вместе с IncrementalTextDataReader.poll, чтобы
+        не обходить весь набор данных после дозаписи файла.
+
+        Студенты, которых больше нет в данных, исключаются
+        из числа должников.
+
+        Args:
+            students: имена студентов, данные которых изменились
+
+        Returns:
+            int: количество студентов с хотя бы одной оценкой < 61
+        """
+        for student in students:
+            if (student in self.data
+                    and self.has_debt(self.data[student])):
+                self.debtors.add(student)
+            else:
+                self.debtors.discard(student)
+        return len(self.debtors)
+
+    @staticmethod
+    def has_debt(subjects: list) -> bool:
         """Проверяет, есть ли у студента академические задолженности
 
         Args:
@@ -40,3 +63,6 @@ class DebtCalculation:
             if score < 61:
                 return True
         return False
+
+    # прежнее имя метода, сохранено для совместимости
+    _has_debt = has_debt
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+from typing import BinaryIO, Iterable, Optional
+from .Types import DataType
+from .TextDataReader import TextDataReader
+
+# Сколько байт в начале и в конце прочитанной части файла
+# учитывается в отпечатке
+FINGERPRINT_WINDOW = 4096
+
+
+class IncrementalTextDataReader(TextDataReader):
+    """Читатель текстового файла, дописываемого в конец
+
+    Запоминает смещение последнего прочитанного байта и текущего
+    студента, поэтому повторный вызов read/poll разбирает только
+    новые строки. Незавершенная последняя строка (без перевода
+    строки) разбирается предварительно: смещение за нее не
+    сдвигается, и при следующем вызове ее разбор отменяется и
+    повторяется с уже дописанной строкой. Если такую строку пока
+    нельзя разобрать (например, оценка записана не полностью),
+    она пропускается до следующего вызова.
+
+    Чтобы не дочитывать чужой файл, вместе со смещением хранится
+    inode файла и отпечаток прочитанной части: хеш ее первых и
+    последних FINGERPRINT_WINDOW байт. Перезапись, не меняющая
+    ни inode, ни эти байты, не обнаруживается.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.offset: int = 0
+        self.inode: int = 0
+        self.fingerprint: str = ""
+        self.tail: str = ""
+        self._tail_undo: Optional[
+            tuple[str, str, Optional[list[tuple[str, int]]]]] = None
+
+    def read(self, path: str) -> DataType:
+        """Дочитывает новые записи файла и возвращает все данные
+
+        Args:
+            path: путь к текстовому файлу
+
+        Returns:
+            DataType: накопленные данные студентов
+        """
+        self.poll(path)
+        return self.students
+
+    def poll(self, path: str) -> set[str]:
+        """Разбирает байты, дописанные после предыдущего чтения
+
+        Если файл стал короче запомненного смещения, заменен другим
+        файлом или его прочитанная часть изменилась, состояние
+        сбрасывается и файл читается с начала. В этом случае в
+        результат входят и все ранее известные студенты, чтобы
+        расчеты, обновляемые по этому множеству, удалили
+        исчезнувших.
+
+        Args:
+            path: путь к текстовому файлу
+
+        Returns:
+            set[str]: имена студентов, данные которых изменились
+        """
+        changed: set[str] = set()
+        undone = self._undo_tail()
+        if undone is not None:
+            changed.add(undone)
+
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            if self.offset and (stat.st_size < self.offset
+                                or stat.st_ino != self.inode
+                                or self._fingerprint(file, self.offset)
+                                != self.fingerprint):
+                changed.update(self.students)
+                self.reset()
+
+            file.seek(self.offset)
+            chunk = file.read()
+            end = chunk.rfind(b"\n") + 1
+            self.offset += end
+            self.inode = stat.st_ino
+            self.fingerprint = self._fingerprint(file, self.offset)
+
+        for line in chunk[:end].decode('utf-8').split("\n")[:-1]:
+            changed.add(self._parse_line(line))
+        if end < len(chunk):
+            parsed = self._parse_tail(chunk[end:])
+            if parsed is not None:
+                changed.add(parsed)
+        return changed
+
+    def reset(self) -> None:
+        """Сбрасывает смещение и накопленные данные"""
+        self.key = ""
+        self.students.clear()
+        self.offset = 0
+        self.inode = 0
+        self.fingerprint = ""
+        self.tail = ""
+        self._tail_undo = None
+
+    def save_state(self, path: str, debtors: Iterable[str] = ()) -> None:
+        """Сохраняет смещение, отпечаток файла и данные в JSON файл
+
+        Предварительно разобранная последняя строка в состояние не
+        попадает: она будет разобрана заново после загрузки. Файл
+        сначала пишется во временный и затем атомарно заменяет
+        прежний, поэтому прерванная запись не портит состояние.
+        Сохраняется весь набор данных, так что время записи и
+        загрузки растет с числом студентов.
+
+        Args:
+            path: путь к файлу состояния
+            debtors: студенты с задолженностями (DebtCalculation.debtors),
+                чтобы после загрузки не пересчитывать их заново
+        """
+        tail = self.tail
+        self._undo_tail()
+        try:
+            state = {
+                "offset": self.offset,
+                "inode": self.inode,
+                "fingerprint": self.fingerprint,
+                "key": self.key,
+                "students": self.students,
+                "debtors": sorted(debtors)
+            }
+            temp = path + ".tmp"
+            with open(temp, 'w', encoding='utf-8') as file:
+                json.dump(state, file, ensure_ascii=False)
+            os.replace(temp, path)
+        finally:
+            if tail:
+                self._parse_tail(tail.encode('utf-8'))
+
+    def load_state(self, path: str) -> set[str]:
+        """Восстанавливает состояние, сохраненное save_state
+
+        Args:
+            path: путь к файлу состояния
+
+        Returns:
+            set[str]: сохраненные студенты с задолженностями
+
+        Raises:
+            FileNotFoundError: если файл состояния не найден
+            ValueError: если файл состояния поврежден или неполон
+        """
+        try:
+            with open(path, encoding='utf-8') as file:
+                state = json.load(file)
+
+            offset = int(state["offset"])
+            inode = int(state["inode"])
+            fingerprint = str(state["fingerprint"])
+            key = str(state["key"])
+            students: DataType = {
+                student: [(subj, score) for subj, score in subjects]
+                for student, subjects in state["students"].items()
+            }
+            debtors = set(state["debtors"])
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Неверный файл состояния {path}: {e}")
+
+        self.reset()
+        self.offset = offset
+        self.inode = inode
+        self.fingerprint = fingerprint
+        self.key = key
+        self.students.update(students)
+        return debtors
+
+    def _parse_tail(self, data: bytes) -> Optional[str]:
+        """Предварительно разбирает незавершенную последнюю строку
+
+        Args:
+            data: байты после последнего перевода строки
+
+        Returns:
+            имя затронутого студента или None, если строку пока
+            нельзя разобрать
+        """
+        try:
+            line = data.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+        key = self.key
+        name = line.strip() if self._is_header(line) else key
+        previous = self.students.get(name)
+        if previous is not None:
+            previous = list(previous)
+        try:
+            self._parse_line(line)
+        except (ValueError, KeyError):
+            return None
+        self.tail = line
+        self._tail_undo = (key, name, previous)
+        return name
+
+    def _undo_tail(self) -> Optional[str]:
+        """Отменяет предварительный разбор последней строки
+
+        Returns:
+            имя затронутого студента или None, если отменять нечего
+        """
+        if self._tail_undo is None:
+            return None
+        key, name, previous = self._tail_undo
+        self.key = key
+        if previous is None:
+            del self.students[name]
+        else:
+            self.students[name] = previous
+        self.tail = ""
+        self._tail_undo = None
+        return name
+
+    def _fingerprint(self, file: BinaryIO, end: int) -> str:
+        digest = hashlib.sha256()
+        file.seek(0)
+        digest.update(file.read(min(end, FINGERPRINT_WINDOW)))
+        start = max(end - FINGERPRINT_WINDOW, 0)
+        file.seek(start)
+        digest.update(file.read(end - start))
+        return digest.hexdigest()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+import math
+import random
+from typing import Iterator, Optional
+from .DataReader import DataReader
+from .CalcRating import CalcRating
+from .DebtCalculation import DebtCalculation
+
+
+class StreamingStatistics:
+    """Приближенная статистика по потоку студентов в ограниченной памяти
+
+    Хранит случайную выборку студентов фиксированного размера
+    (reservoir sampling), гистограмму средних оценок CalcRating для
+    квантилей, бегущее среднее рейтинга и долю студентов
+    с задолженностями с доверительными интервалами.
+
+    Доверительные интервалы верны, только если обработанные студенты
+    являются случайной выборкой, поэтому ранняя остановка в run
+    читает студентов в случайном порядке (см. DataReader.iter_shuffled).
+    Студенты учитываются в том виде, в каком их выдает reader, например,
+    повторные блоки одного студента в текстовом файле считаются
+    отдельно.
+    """
+
+    def __init__(self, sample_size: int = 100, bins: int = 100,
+                 low: float = 0.0, high: float = 100.0, z: float = 1.96,
+                 seed: Optional[int] = None) -> None:
+        """Инициализация пустой статистики
+
+        Args:
+            sample_size: размер случайной выборки студентов
+            bins: число интервалов гистограммы рейтинга
+            low: нижняя граница гистограммы
+            high: верхняя граница гистограммы
+            z: квантиль нормального распределения для интервалов
+                (1.96 соответствует уровню доверия 95%)
+            seed: начальное значение генератора для выборки
+        """
+        if sample_size < 1 or bins < 1 or high <= low:
+            raise ValueError("Неверные параметры статистики")
+        self.sample_size = sample_size
+        self.low = low
+        self.high = high
+        self.z = z
+        self.histogram: list[int] = [0] * bins
+        self.sample: list[tuple[str, float]] = []
+        self.count = 0
+        self.rated = 0
+        self.debtors = 0
+        self.out_of_range = 0
+        self.mean_rating = 0.0
+        self._m2 = 0.0
+        self._random = random.Random(seed)
+
+    def add(self, student: str, subjects: list[tuple[str, int]]) -> None:
+        """Учитывает одного студента
+
+        Args:
+            student: имя студента
+            subjects: список предметов студента
+        """
+        self.count += 1
+        if DebtCalculation.has_debt(subjects):
+            self.debtors += 1
+
+        rating = CalcRating({student: subjects}).calc().get(student)
+        if rating is None:
+            return
+
+        self.rated += 1
+        delta = rating - self.mean_rating
+        self.mean_rating += delta / self.rated
+        self._m2 += delta * (rating - self.mean_rating)
+
+        width = (self.high - self.low) / len(self.histogram)
+        index = int((rating - self.low) / width)
+        if not self.low <= rating <= self.high:
+            self.out_of_range += 1
+        self.histogram[min(max(index, 0), len(self.histogram) - 1)] += 1
+
+        if len(self.sample) < self.sample_size:
+            self.sample.append((student, rating))
+        else:
+            position = self._random.randrange(self.rated)
+            if position < self.sample_size:
+                self.sample[position] = (student, rating)
+
+    def run(self, reader: DataReader, path: str,
+            debt_rate_error: Optional[float] = None,
+            rating_error: Optional[float] = None,
+            min_students: int = 30,
+            random_order: bool = False) -> "StreamingStatistics":
+        """Обрабатывает файл потоком через reader.iter_students
+
+        Если задана хотя бы одна допустимая погрешность, чтение
+        прекращается, как только полуширина соответствующих
+        доверительных интервалов станет не больше заданной. Для этого
+        студенты читаются в случайном порядке через
+        reader.iter_shuffled. Если читатель его не поддерживает
+        (reader.supports_shuffle равен False),
+        ранняя остановка допускается только с random_order=True,
+        то есть когда вызывающий гарантирует, что студенты
+        в файле уже перемешаны.
+
+        Args:
+            reader: читатель данных
+            path: путь к файлу
+            debt_rate_error: допустимая погрешность доли должников
+            rating_error: допустимая погрешность среднего рейтинга
+            min_students: минимальное число студентов до остановки
+            random_order: студенты в файле записаны в случайном порядке
+
+        Returns:
+            StreamingStatistics: эта же статистика
+
+        Raises:
+            ValueError: если ранняя остановка запрошена для читателя
+                без случайного порядка и random_order не задан
+        """
+        early_stop = debt_rate_error is not None or rating_error is not None
+        if early_stop:
+            stream = self._shuffled(reader, path, random_order)
+        else:
+            stream = reader.iter_students(path)
+
+        for student, subjects in stream:
+            self.add(student, subjects)
+            if (early_stop and self.count >= min_students
+                    and self.converged(debt_rate_error, rating_error)):
+                break
+        return self
+
+    def _shuffled(self, reader: DataReader, path: str,
+                  random_order: bool) -> Iterator[
+                      tuple[str, list[tuple[str, int]]]]:
+        if reader.supports_shuffle:
+            return reader.iter_shuffled(path, self._random)
+        if not random_order:
+            raise ValueError(
+                f"Ранняя остановка для {type(reader).__name__} "
+                f"возможна только при случайном порядке студентов "
+                f"в файле: передайте random_order=True")
+        return reader.iter_students(path)
+
+    def converged(self, debt_rate_error: Optional[float] = None,
+                  rating_error: Optional[float] = None) -> bool:
+        """Проверяет, достигнута ли заданная точность
+
+        Args:
+            debt_rate_error: допустимая погрешность доли должников
+            rating_error: допустимая погрешность среднего рейтинга
+
+        Returns:
+            bool: True если все заданные погрешности достигнуты
+        """
+        if debt_rate_error is not None:
+            low, high = self.debt_rate_interval()
+            if (high - low) / 2 > debt_rate_error:
+                return False
+        if rating_error is not None:
+            low, high = self.rating_interval()
+            if (high - low) / 2 > rating_error:
+                return False
+        return True
+
+    @property
+    def debt_rate(self) -> float:
+        """Доля студентов с задолженностями"""
+        return self.debtors / self.count if self.count else 0.0
+
+    def debt_rate_interval(self) -> tuple[float, float]:
+        """Доверительный интервал Уилсона для доли должников
+
+        Returns:
+            tuple[float, float]: нижняя и верхняя граница
+        """
+        if not self.count:
+            return 0.0, 1.0
+        n, p, z = self.count, self.debt_rate, self.z
+        center = (p + z * z / (2 * n)) / (1 + z * z / n)
+        half = (z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+                / (1 + z * z / n))
+        return max(center - half, 0.0), min(center + half, 1.0)
+
+    def rating_interval(self) -> tuple[float, float]:
+        """Доверительный интервал для среднего рейтинга
+
+        Returns:
+            tuple[float, float]: нижняя и верхняя граница
+        """
+        if self.rated < 2:
+            return self.low, self.high
+        half = self.z * math.sqrt(self._m2 / (self.rated - 1) / self.rated)
+        return self.mean_rating - half, self.mean_rating + half
+
+    def quantile(self, q: float) -> float:
+        """Приближенный квантиль рейтинга по гистограмме
+
+        Рейтинги вне [low, high] относятся к крайним интервалам
+        гистограммы (их число хранится в out_of_range). Погрешность не
+        превышает ширины одного интервала, только если таких рейтингов
+        нет или квантиль приходится на интервалы без них; иначе она
+        не ограничена.
+
+        Args:
+            q: уровень квантиля от 0 до 1
+
+        Returns:
+            float: значение рейтинга
+
+        Raises:
+            ValueError: если q вне [0, 1] или данных еще нет
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"Уровень квантиля должен быть в [0, 1]: {q}")
+        if not self.rated:
+            raise ValueError("Нет данных для расчета квантиля")
+
+        width = (self.high - self.low) / len(self.histogram)
+        target = q * self.rated
+        seen = 0
+        for index, amount in enumerate(self.histogram):
+            if amount and seen + amount >= target:
+                return self.low + width * (index + (target - seen) / amount)
+            seen += amount
+        return self.high
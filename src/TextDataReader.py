@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from typing import Iterator
 from .Types import DataType
 from .DataReader import DataReader
 
@@ -12,11 +13,54 @@ class TextDataReader(DataReader):
     def read(self, path: str) -> DataType:
         with open(path, encoding='utf-8') as file:
             for line in file:
-                if not line.startswith(" "):
-                    self.key = line.strip()
-                    self.students[self.key] = []
-                else:
-                    subj, score = line.split(":", maxsplit=1)
-                    self.students[self.key].append(
-                        (subj.strip(), int(score.strip())))
+                self._parse_line(line)
         return self.students
+
+    def iter_students(self, path: str) -> Iterator[
+            tuple[str, list[tuple[str, int]]]]:
+        """Читает файл потоком, храня в памяти только одного студента
+
+        В отличие от read, повторно встретившееся имя студента не
+        заменяет прежние данные: каждый блок выдается отдельно,
+        так как для этого пришлось бы помнить всех студентов.
+
+        Args:
+            path: путь к текстовому файлу
+
+        Returns:
+            итератор пар (имя студента, список оценок)
+        """
+        buffer = TextDataReader()
+        with open(path, encoding='utf-8') as file:
+            for line in file:
+                if self._is_header(line) and buffer.students:
+                    yield from buffer.students.items()
+                    buffer.students.clear()
+                buffer._parse_line(line)
+        yield from buffer.students.items()
+
+    def _parse_line(self, line: str) -> str:
+        """Разбирает одну строку текстового файла
+
+        Строка без отступа задает нового студента, строка с отступом -
+        оценку по предмету для текущего студента.
+
+        Args:
+            line: строка файла
+
+        Returns:
+            str: имя студента, данные которого изменились
+        """
+        if self._is_header(line):
+            self.key = line.strip()
+            self.students[self.key] = []
+        else:
+            self.students[self.key].append(self._parse_score(line))
+        return self.key
+
+    def _is_header(self, line: str) -> bool:
+        return not line.startswith(" ")
+
+    def _parse_score(self, line: str) -> tuple[str, int]:
+        subj, score = line.split(":", maxsplit=1)
+        return subj.strip(), int(score.strip())
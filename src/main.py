@@ -2,28 +2,83 @@
 import argparse
 import sys
 import os
+from src.Types import DataType
 from src.TextDataReader import TextDataReader
+from src.IncrementalTextDataReader import IncrementalTextDataReader
 from src.JsonDataReader import JsonDataReader
+from src.BinaryDataReader import BinaryDataReader
 from src.DebtCalculation import DebtCalculation
 
 # Добавляем путь к src в sys.path для импортов
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 
-def get_path_from_arguments(args) -> str:
+def get_arguments(args) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Path to datafile")
     parser.add_argument("-p", dest="path", type=str, required=True,
                         help="Path to datafile")
+    parser.add_argument("-s", dest="state", type=str, default=None,
+                        help="Path to state file for append-only "
+                             "text datafile (skips re-parsing old lines; "
+                             "the state holds the whole dataset, so "
+                             "loading it is still linear in its size)")
     args = parser.parse_args(args)
-    return args.path
+    if args.state is not None and args.path.endswith(('.json', '.bin')):
+        parser.error("-s is supported only for text datafiles")
+    return args
+
+
+def get_path_from_arguments(args) -> str:
+    return get_arguments(args).path
+
+
+def refresh_with_state(path: str, state: str) -> tuple[DataType, int]:
+    """Дочитывает текстовый файл с места, сохраненного в файле состояния
+
+    Разбираются только дописанные строки, а задолженности
+    пересчитываются только для изменившихся студентов. Файл состояния
+    хранит весь набор данных, поэтому его чтение и запись по-прежнему
+    занимают время, пропорциональное числу студентов. Поврежденный
+    или устаревший файл состояния игнорируется, и текстовый файл
+    читается целиком.
+
+    Args:
+        path: путь к текстовому файлу
+        state: путь к файлу состояния (создается при первом запуске)
+
+    Returns:
+        tuple[DataType, int]: данные студентов и количество должников
+    """
+    reader = IncrementalTextDataReader()
+    debt_calculator = DebtCalculation(reader.students)
+    try:
+        debt_calculator.debtors = reader.load_state(state)
+    except (OSError, ValueError):
+        reader.reset()
+        reader.read(path)
+        debt_count = debt_calculator.count_students_with_debts()
+    else:
+        debt_count = debt_calculator.update(reader.poll(path))
+    reader.save_state(state, debt_calculator.debtors)
+    return reader.students, debt_count
 
 
 def main():
-    path = get_path_from_arguments(sys.argv[1:])
+    args = get_arguments(sys.argv[1:])
+    path = args.path
+
+    if args.state is not None:
+        students, debt_count = refresh_with_state(path, args.state)
+        print("Students: ", students)
+        print(f"Количество студентов с академическими "
+              f"задолженностями: {debt_count}")
+        return
 
     # Определяем тип reader на основе расширения файла
     if path.endswith('.json'):
         reader = JsonDataReader()
+    elif path.endswith('.bin'):
+        reader = BinaryDataReader()
     else:
         reader = TextDataReader()
 
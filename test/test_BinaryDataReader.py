@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import random
+import pytest
+from src.Types import DataType
+from src.TextDataReader import TextDataReader
+from src.JsonDataReader import JsonDataReader
+from src.BinaryDataReader import (BinaryDataReader, BinaryGradeFile,
+                                  SCORE_ENTRY)
+from src.BinaryDataWriter import BinaryDataWriter
+
+
+class TestBinaryDataReader:
+
+    @pytest.fixture()
+    def data(self) -> DataType:
+        return {
+            "Я Без Оценок": [],
+            "Петров Петр Семенович": [
+                ("русский язык", 87), ("литература", 78)
+            ],
+            "Иванов Константин Дмитриевич": [
+                ("математика", 91), ("химия", 100)
+            ],
+            "Сидоров Алексей Викторович": [
+                ("математика", 59), ("химия", 75)
+            ],
+            "Без Оценок": [],
+            "Алексеев Андрей": [("физика", 60.5)]
+        }
+
+    @pytest.fixture()
+    def filepath(self, data: DataType, tmpdir) -> str:
+        p = str(tmpdir.mkdir("datadir").join("my_data.bin"))
+        BinaryDataWriter().write(data, p)
+        return p
+
+    def test_read_roundtrip(self, data: DataType, filepath: str) -> None:
+        content = BinaryDataReader().read(filepath)
+        assert content == data
+        assert list(content) == list(data)
+
+    def test_convert_from_text(self, tmpdir) -> None:
+        text = tmpdir.join("my_data.txt")
+        text.write_text("Иванов Константин Дмитриевич\n" +
+                        "    математика:91\n", encoding='utf-8')
+        data = TextDataReader().read(str(text))
+        binary = str(tmpdir.join("my_data.bin"))
+        BinaryDataWriter().write(data, binary)
+        assert BinaryDataReader().read(binary) == data
+
+    def test_get(self, data: DataType, filepath: str) -> None:
+        with BinaryGradeFile(filepath) as grades:
+            assert len(grades) == len(data)
+            for student, subjects in data.items():
+                assert student in grades
+                assert grades.get(student) == subjects
+            assert grades.get("Неизвестный Студент") is None
+
+    def test_iter_shuffled(self, data: DataType, filepath: str) -> None:
+        rng = random.Random(1)
+        students = list(BinaryDataReader().iter_shuffled(filepath, rng))
+        assert sorted(name for name, _ in students) == sorted(data)
+        assert dict(students) == data
+
+    def test_has_debt(self, filepath: str) -> None:
+        with BinaryGradeFile(filepath) as grades:
+            assert grades.has_debt("Сидоров Алексей Викторович") is True
+            assert grades.has_debt("Петров Петр Семенович") is False
+            with pytest.raises(KeyError):
+                grades.has_debt("Неизвестный Студент")
+
+    def test_convert_from_json(self, tmpdir) -> None:
+        json_file = tmpdir.join("my_data.json")
+        json_file.write_text('{"Иванов": {"химия": 60.5, "физика": 70}}',
+                             encoding='utf-8')
+        data = JsonDataReader().read(str(json_file))
+        binary = str(tmpdir.join("my_data.bin"))
+        BinaryDataWriter().write(data, binary)
+        content = BinaryDataReader().read(binary)
+        assert content == data
+        assert [type(score) for _, score in content["Иванов"]] == [
+            float, int]
+
+    @pytest.mark.parametrize("score", ["60", None, True, 2 ** 63])
+    def test_write_invalid_score(self, score, tmpdir) -> None:
+        with pytest.raises(ValueError):
+            BinaryDataWriter().write({"Иванов": [("химия", score)]},
+                                     str(tmpdir.join("my_data.bin")))
+
+    def test_read_wrong_format(self, tmpdir) -> None:
+        p = tmpdir.join("my_data.bin")
+        p.write_text("Иванов Константин Дмитриевич\n", encoding='utf-8')
+        with pytest.raises(ValueError):
+            BinaryDataReader().read(str(p))
+
+    @pytest.mark.parametrize("cut", [1, 5, 40])
+    def test_read_truncated(self, filepath: str, cut: int) -> None:
+        with open(filepath, 'rb') as file:
+            content = file.read()
+        with open(filepath, 'wb') as file:
+            file.write(content[:-cut])
+        with pytest.raises(ValueError):
+            BinaryDataReader().read(filepath)
+
+    def test_read_bad_subject_id(self, tmpdir) -> None:
+        p = str(tmpdir.join("my_data.bin"))
+        BinaryDataWriter().write({"Иванов": [("химия", 60)]}, p)
+        with open(p, 'r+b') as file:
+            file.seek(-SCORE_ENTRY.size, 2)
+            file.write(SCORE_ENTRY.pack(7, 0, bytes(8)))
+        with pytest.raises(ValueError):
+            BinaryDataReader().read(p)
+
+    def test_write_long_subject(self, tmpdir) -> None:
+        with pytest.raises(ValueError):
+            BinaryDataWriter().write({"Иванов": [("х" * 40000, 60)]},
+                                     str(tmpdir.join("my_data.bin")))
@@ -73,6 +73,11 @@ class TestDebtCalculation:
         subjects = [("математика", 75), ("физика", 61), ("химия", 80)]
         assert calculator._has_debt(subjects) is False
 
+    def test_has_debt_static(self):
+        """Тест проверки задолженности без экземпляра класса"""
+        assert DebtCalculation.has_debt([("физика", 60)]) is True
+        assert DebtCalculation.has_debt([("физика", 61)]) is False
+
     def test_integration_with_json_reader(self, tmpdir):
         """Интеграционный тест с JsonDataReader"""
         from src.JsonDataReader import JsonDataReader
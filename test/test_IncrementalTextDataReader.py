@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import os
+import pytest
+from src.Types import DataType
+from src.CalcRating import CalcRating
+from src.DebtCalculation import DebtCalculation
+from src.TextDataReader import TextDataReader
+from src.IncrementalTextDataReader import IncrementalTextDataReader
+
+
+class TestIncrementalTextDataReader:
+
+    @pytest.fixture()
+    def filepath(self, tmpdir) -> str:
+        p = tmpdir.mkdir("datadir").join("my_data.txt")
+        p.write_text("Иванов Константин Дмитриевич\n" +
+                     "    математика:91\n", encoding='utf-8')
+        return str(p)
+
+    def append(self, path: str, text: str) -> None:
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(text)
+
+    def test_read_appended_records(self, filepath: str) -> None:
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        self.append(filepath, "    химия:100\n" +
+                    "Петров Петр Семенович\n" + "    литература:50\n")
+        data: DataType = reader.read(filepath)
+        assert data == {
+            "Иванов Константин Дмитриевич": [
+                ("математика", 91), ("химия", 100)
+            ],
+            "Петров Петр Семенович": [("литература", 50)]
+        }
+
+    def test_poll_returns_changed_students(self, filepath: str) -> None:
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        self.append(filepath, "Петров Петр Семенович\n" +
+                    "    литература:50\n")
+        assert reader.poll(filepath) == {"Петров Петр Семенович"}
+        assert reader.poll(filepath) == set()
+
+    def test_partial_line_is_not_consumed(self, filepath: str) -> None:
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        self.append(filepath, "    химия:1")
+        reader.poll(filepath)
+        self.append(filepath, "00\n")
+        reader.poll(filepath)
+        assert reader.students["Иванов Константин Дмитриевич"] == [
+            ("математика", 91), ("химия", 100)
+        ]
+
+    def test_truncated_file_is_reread(self, filepath: str) -> None:
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("Петров Петр Семенович\n")
+        assert reader.read(filepath) == {"Петров Петр Семенович": []}
+
+    def test_state_roundtrip(self, filepath: str, tmpdir) -> None:
+        state = str(tmpdir.join("state.json"))
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        reader.save_state(state)
+        self.append(filepath, "    химия:100\n")
+
+        restored = IncrementalTextDataReader()
+        restored.load_state(state)
+        assert restored.poll(filepath) == {"Иванов Константин Дмитриевич"}
+        assert restored.students == IncrementalTextDataReader().read(
+            filepath)
+
+    def test_refresh_calculations(self, filepath: str) -> None:
+        reader = IncrementalTextDataReader()
+        students = reader.read(filepath)
+        debts = DebtCalculation(students)
+        rating = CalcRating(students)
+        assert debts.count_students_with_debts() == 0
+        rating.calc()
+
+        self.append(filepath, "Петров Петр Семенович\n" +
+                    "    литература:50\n")
+        changed = reader.poll(filepath)
+        assert debts.update(changed) == 1
+        assert rating.calc(changed) == {
+            "Иванов Константин Дмитриевич": 91.0,
+            "Петров Петр Семенович": 50.0
+        }
+
+    def test_refresh_calculations_after_truncation(
+            self, filepath: str) -> None:
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("A\n    m:10\nB\n    m:90\n")
+        reader = IncrementalTextDataReader()
+        students = reader.read(filepath)
+        debts = DebtCalculation(students)
+        rating = CalcRating(students)
+        assert debts.count_students_with_debts() == 1
+        rating.calc()
+
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("C\n    m:99\n")
+        changed = reader.poll(filepath)
+        assert changed == {"A", "B", "C"}
+        assert debts.update(changed) == 0
+        assert rating.calc(changed) == {"C": 99.0}
+
+    def test_same_size_rewrite_is_reread(self, filepath: str) -> None:
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("A\n    m:10\n")
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        with open(filepath, 'w', encoding='utf-8') as file:
+            file.write("Z\n    m:99\n")
+        assert reader.read(filepath) == {"Z": [("m", 99)]}
+
+    def test_replaced_file_is_reread(self, filepath: str, tmpdir) -> None:
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        other = str(tmpdir.join("other.txt"))
+        with open(other, 'w', encoding='utf-8') as file:
+            file.write("Иванов Константин Дмитриевич\n" +
+                       "    химия:100\n")
+        os.replace(other, filepath)
+        assert reader.read(filepath) == {
+            "Иванов Константин Дмитриевич": [("химия", 100)]
+        }
+
+    def test_final_line_without_newline(self, filepath: str) -> None:
+        self.append(filepath, "Петров Петр Семенович\n" +
+                    "    литература:5")
+        reader = IncrementalTextDataReader()
+        assert reader.read(filepath) == TextDataReader().read(filepath)
+        assert reader.poll(filepath) == {"Петров Петр Семенович"}
+
+        self.append(filepath, "0\n")
+        assert reader.poll(filepath) == {"Петров Петр Семенович"}
+        assert reader.students["Петров Петр Семенович"] == [
+            ("литература", 50)]
+
+    def test_unterminated_header_is_undone(self, filepath: str) -> None:
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        self.append(filepath, "Иванов Константин Дмитрие")
+        reader.poll(filepath)
+        self.append(filepath, "вич\n    химия:100\n")
+        reader.poll(filepath)
+        assert reader.students == TextDataReader().read(filepath)
+
+    def test_state_excludes_unterminated_line(self, filepath: str,
+                                              tmpdir) -> None:
+        state = str(tmpdir.join("state.json"))
+        self.append(filepath, "    химия:10")
+        reader = IncrementalTextDataReader()
+        reader.read(filepath)
+        reader.save_state(state)
+        assert reader.students["Иванов Константин Дмитриевич"] == [
+            ("математика", 91), ("химия", 10)]
+
+        self.append(filepath, "0\n")
+        restored = IncrementalTextDataReader()
+        restored.load_state(state)
+        assert restored.read(filepath) == TextDataReader().read(filepath)
+
+    def test_load_broken_state(self, tmpdir) -> None:
+        state = tmpdir.join("state.json")
+        state.write_text("{broken", encoding='utf-8')
+        with pytest.raises(ValueError):
+            IncrementalTextDataReader().load_state(str(state))
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+import pytest
+from src.Types import DataType
+from src.TextDataReader import TextDataReader
+from src.JsonDataReader import JsonDataReader
+from src.BinaryDataWriter import BinaryDataWriter
+from src.BinaryDataReader import BinaryDataReader
+from src.DebtCalculation import DebtCalculation
+from src.StreamingStatistics import StreamingStatistics
+
+
+class TestStreamingStatistics:
+
+    @pytest.fixture()
+    def data(self) -> DataType:
+        return {
+            f"Студент {i}": [("математика", 40 + i % 60),
+                             ("химия", 60 + i % 41)]
+            for i in range(1000)
+        }
+
+    @pytest.fixture()
+    def filepath(self, data: DataType, tmpdir) -> str:
+        p = tmpdir.join("my_data.txt")
+        lines = []
+        for student, subjects in data.items():
+            lines.append(student)
+            lines += [f"    {subj}:{score}" for subj, score in subjects]
+        p.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return str(p)
+
+    def test_full_pass(self, data: DataType, filepath: str) -> None:
+        stats = StreamingStatistics(sample_size=10, seed=1).run(
+            TextDataReader(), filepath)
+        debts = DebtCalculation(data).count_students_with_debts()
+        assert stats.count == len(data)
+        assert stats.debt_rate == debts / len(data)
+        assert len(stats.sample) == 10
+        low, high = stats.debt_rate_interval()
+        assert low <= stats.debt_rate <= high
+
+    def test_quantile(self) -> None:
+        stats = StreamingStatistics(bins=100)
+        for i in range(101):
+            stats.add(f"Студент {i}", [("математика", i)])
+        assert stats.quantile(0.5) == pytest.approx(50, abs=1)
+        assert stats.quantile(0.0) == pytest.approx(0, abs=1)
+        assert stats.quantile(1.0) == pytest.approx(100, abs=1)
+        with pytest.raises(ValueError):
+            stats.quantile(1.5)
+
+    def test_early_stop(self, data: DataType, filepath: str) -> None:
+        stats = StreamingStatistics(seed=1).run(
+            TextDataReader(), filepath, debt_rate_error=0.1,
+            random_order=True)
+        assert stats.count < len(data)
+        assert stats.converged(debt_rate_error=0.1)
+
+    def test_early_stop_requires_random_order(self,
+                                              filepath: str) -> None:
+        with pytest.raises(ValueError):
+            StreamingStatistics().run(TextDataReader(), filepath,
+                                      debt_rate_error=0.1)
+
+    def test_early_stop_checks_capability(self, filepath: str) -> None:
+        class LazyReader(TextDataReader):
+            def iter_shuffled(self, path, rng):
+                yield from self.iter_students(path)
+                raise NotImplementedError
+
+        with pytest.raises(ValueError):
+            StreamingStatistics().run(LazyReader(), filepath,
+                                      debt_rate_error=0.1)
+
+    def test_out_of_range_ratings(self) -> None:
+        stats = StreamingStatistics(low=0.0, high=100.0)
+        stats.add("Иванов", [("математика", 150)])
+        stats.add("Петров", [("математика", 50)])
+        assert stats.out_of_range == 1
+        assert stats.quantile(1.0) == 100.0
+
+    def test_early_stop_on_sorted_binary(self, tmpdir) -> None:
+        # имена отсортированы так, что все должники идут первыми:
+        # префикс в порядке индекса дал бы долю должников 1.0
+        data = {f"{i:04d}": [("математика", 40 if i < 500 else 90)]
+                for i in range(2000)}
+        binary = str(tmpdir.join("my_data.bin"))
+        BinaryDataWriter().write(data, binary)
+        covered = 0
+        for seed in range(20):
+            stats = StreamingStatistics(seed=seed).run(
+                BinaryDataReader(), binary, debt_rate_error=0.05)
+            assert stats.count < len(data)
+            low, high = stats.debt_rate_interval()
+            assert high - low <= 0.1
+            covered += low <= 0.25 <= high
+        assert covered >= 17
+
+    def test_students_without_grades(self) -> None:
+        stats = StreamingStatistics()
+        stats.add("Без Оценок", [])
+        assert stats.count == 1
+        assert stats.rated == 0
+        assert stats.sample == []
+
+    def test_any_reader(self, data: DataType, filepath: str,
+                        tmpdir) -> None:
+        binary = str(tmpdir.join("my_data.bin"))
+        BinaryDataWriter().write(data, binary)
+        text = StreamingStatistics().run(TextDataReader(), filepath)
+        stats = StreamingStatistics().run(BinaryDataReader(), binary)
+        assert stats.count == text.count
+        assert stats.mean_rating == pytest.approx(text.mean_rating)
+
+        json_file = tmpdir.join("my_data.json")
+        json_file.write_text('{"Иванов": {"химия": 45}}', encoding='utf-8')
+        stats = StreamingStatistics().run(JsonDataReader(), str(json_file))
+        assert stats.debt_rate == 1.0
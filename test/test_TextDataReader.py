@@ -34,3 +34,20 @@ class TestTextDataReader:
     def test_read(self, filepath_and_data: tuple[str, DataType]) -> None:
         file_content = TextDataReader().read(filepath_and_data[0])
         assert file_content == filepath_and_data[1]
+
+    def test_iter_students(self,
+                           filepath_and_data: tuple[str, DataType]) -> None:
+        students = dict(TextDataReader().iter_students(filepath_and_data[0]))
+        assert students == filepath_and_data[1]
+
+    def test_iter_students_duplicate_name(self, tmpdir) -> None:
+        p = tmpdir.join("my_data.txt")
+        p.write_text("Иванов\n    химия:45\nПетров\n    химия:90\n" +
+                     "Иванов\n    химия:80\n", encoding='utf-8')
+        assert TextDataReader().read(str(p)) == {
+            "Иванов": [("химия", 80)], "Петров": [("химия", 90)]
+        }
+        assert list(TextDataReader().iter_students(str(p))) == [
+            ("Иванов", [("химия", 45)]), ("Петров", [("химия", 90)]),
+            ("Иванов", [("химия", 80)])
+        ]
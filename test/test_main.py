@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-from src.main import get_path_from_arguments
+from src.main import (get_arguments, get_path_from_arguments,
+                      refresh_with_state)
 import sys
 import os
 import pytest
@@ -27,3 +28,57 @@ def test_get_path_from_noncorrect_arguments(
     with pytest.raises(SystemExit) as e:
         get_path_from_arguments(noncorrect_arguments_string[0])
     assert e.type == SystemExit
+
+
+def test_refresh_with_state(tmpdir) -> None:
+    path = str(tmpdir.join("my_data.txt"))
+    state = str(tmpdir.join("state.json"))
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("Иванов Иван\n    математика:75\n")
+    assert refresh_with_state(path, state)[1] == 0
+
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write("Сидоров Алексей\n    химия:45\n")
+    students, debt_count = refresh_with_state(path, state)
+    assert debt_count == 1
+    assert students == {
+        "Иванов Иван": [("математика", 75)],
+        "Сидоров Алексей": [("химия", 45)]
+    }
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("Петров Петр\n    химия:90\n")
+    assert refresh_with_state(path, state) == (
+        {"Петров Петр": [("химия", 90)]}, 0)
+
+
+def test_refresh_with_state_without_final_newline(tmpdir) -> None:
+    path = str(tmpdir.join("my_data.txt"))
+    state = str(tmpdir.join("state.json"))
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("A\n    m:90\nB\n    m:40")
+    expected = {"A": [("m", 90)], "B": [("m", 40)]}
+    assert refresh_with_state(path, state) == (expected, 1)
+    assert refresh_with_state(path, state) == (expected, 1)
+
+    with open(path, 'a', encoding='utf-8') as file:
+        file.write("0\n")
+    assert refresh_with_state(path, state) == (
+        {"A": [("m", 90)], "B": [("m", 400)]}, 0)
+
+
+def test_refresh_with_broken_state(tmpdir) -> None:
+    path = str(tmpdir.join("my_data.txt"))
+    state = tmpdir.join("state.json")
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write("A\n    m:40\n")
+    for content in ["{broken", '{"offset": 0}']:
+        state.write_text(content, encoding='utf-8')
+        assert refresh_with_state(path, str(state)) == (
+            {"A": [("m", 40)]}, 1)
+
+
+@pytest.mark.parametrize("path", ["data.json", "data.bin"])
+def test_state_rejected_for_non_text(path: str) -> None:
+    with pytest.raises(SystemExit):
+        get_arguments(["-p", path, "-s", "state.json"])